@@ -0,0 +1,312 @@
+"""
+AVALIAR DECODIFICAÇÃO - Velocidade vs precisão do Whisper (WER/CER)
+
+Roda um corpus local (áudio + referência .txt com o mesmo nome) numa
+grade de modelos × opções de decodificação × modo de transcrição e
+registra, para cada combinação:
+  - WER e CER da transcrição bruta e após limpar_profissional
+  - fator de tempo real (RTF = tempo de transcrição / duração do áudio)
+
+Métricas agregadas no corpus (total de edições / total da referência).
+A tabela final, agrupada por modo, marca com ⭐ as combinações na
+fronteira de Pareto do seu modo (nenhuma outra do mesmo modo é ao mesmo
+tempo mais rápida e mais precisa).
+
+Modos (os dois caminhos de transcrever_profissional):
+  - completo:  model.transcribe no arquivo inteiro, como no --sem-pyannote
+  - segmentos: cada trecho transcrito isoladamente, sem contexto entre
+    trechos, como no caminho padrão com PyAnnote (transcrever_segmento).
+    Aproxima os turnos da diarização com janelas fixas de JANELA_SEGUNDOS;
+    não inclui o custo dos cortes com ffmpeg nem da diarização, então o
+    RTF real desse caminho é maior.
+
+    corpus/
+    ├── aula1.mp3
+    ├── aula1.txt    # transcrição de referência
+    └── ...
+"""
+import sys
+import os
+import re
+import csv
+import time
+import unicodedata
+from pathlib import Path
+
+from transcrever_profissional import OPCOES_DECODIFICACAO
+from limpar_profissional import limpar_texto
+
+EXTENSOES_AUDIO = ('.wav', '.mp3', '.m4a', '.mp4', '.flac', '.ogg', '.webm')
+
+MODELOS_PADRAO = ('tiny', 'base', 'small')
+
+MODOS = ('completo', 'segmentos')
+
+# Tamanho dos trechos no modo "segmentos" (turnos típicos da diarização)
+JANELA_SEGUNDOS = 10.0
+
+# Nome → opções passadas ao model.transcribe
+GRADE_OPCOES = {
+    'atual': OPCOES_DECODIFICACAO,
+    'beam5': {**OPCOES_DECODIFICACAO, 'beam_size': 5},
+    'contexto': {**OPCOES_DECODIFICACAO, 'condition_on_previous_text': True},
+    'padrao_whisper': {
+        'beam_size': 5,
+        'best_of': 5,
+        'temperature': (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        'condition_on_previous_text': True,
+    },
+}
+
+_REGEX_NAO_PALAVRA = re.compile(r'[^\w\s]')
+
+def normalizar_avaliacao(texto):
+    """Minúsculas, sem pontuação e espaços colapsados (capitalização e ponto final não contam)"""
+    texto = unicodedata.normalize('NFC', texto.lower())
+    return ' '.join(_REGEX_NAO_PALAVRA.sub(' ', texto).split())
+
+def distancia_edicao(referencia, hipotese):
+    """
+    Distância de Levenshtein entre duas sequências, vetorizada por linha:
+    a dependência de inserção dentro da linha vira um mínimo acumulado.
+    """
+    import numpy as np
+
+    if not referencia:
+        return len(hipotese)
+    if not hipotese:
+        return len(referencia)
+
+    vocab = {}
+    ref = np.array([vocab.setdefault(t, len(vocab)) for t in referencia], dtype=np.int64)
+    hip = np.array([vocab.setdefault(t, len(vocab)) for t in hipotese], dtype=np.int64)
+
+    indices = np.arange(len(hip) + 1)
+    linha = indices.copy()
+    for i, r in enumerate(ref, 1):
+        # Substituição/acerto (diagonal) e remoção (de cima)
+        nova = np.empty_like(linha)
+        nova[0] = i
+        nova[1:] = np.minimum(linha[:-1] + (hip != r), linha[1:] + 1)
+        # Inserção (da esquerda): nova[j] = min_k (nova[k] + j - k)
+        linha = np.minimum.accumulate(nova - indices) + indices
+    return int(linha[-1])
+
+def transcrever_audio(model, audio, opcoes, modo, tem_gpu):
+    """Transcreve um áudio já decodificado (16 kHz) no modo pedido; retorna o texto"""
+    import whisper
+
+    if modo == 'completo':
+        trechos = [audio]
+    else:
+        passo = int(JANELA_SEGUNDOS * whisper.audio.SAMPLE_RATE)
+        minimo = int(0.5 * whisper.audio.SAMPLE_RATE)  # mesmo corte de < 0.5s da produção
+        trechos = [audio[i:i + passo] for i in range(0, len(audio), passo)]
+        trechos = [t for t in trechos if len(t) >= minimo]
+
+    textos = []
+    for trecho in trechos:
+        resultado = model.transcribe(
+            trecho,
+            language='pt',
+            fp16=tem_gpu,
+            word_timestamps=False,
+            **opcoes
+        )
+        textos.append(resultado.get('text', '').strip())
+    return ' '.join(textos)
+
+def listar_corpus(pasta):
+    """Retorna [(audio, texto_referencia)] para cada áudio com .txt correspondente"""
+    pares = []
+    for audio in sorted(Path(pasta).iterdir()):
+        if audio.suffix.lower() not in EXTENSOES_AUDIO:
+            continue
+        referencia = audio.with_suffix('.txt')
+        if not referencia.exists():
+            print(f"⚠️  Sem referência: {audio.name}")
+            continue
+        pares.append((str(audio), referencia.read_text(encoding='utf-8')))
+    return pares
+
+def _fronteira_pareto(resultados, eixo_x='rtf', eixo_y='wer_limpo'):
+    """Marca resultados não dominados (menor RTF e menor WER)"""
+    for r in resultados:
+        r['pareto'] = not any(
+            o[eixo_x] <= r[eixo_x] and o[eixo_y] <= r[eixo_y]
+            and (o[eixo_x] < r[eixo_x] or o[eixo_y] < r[eixo_y])
+            for o in resultados
+        )
+
+def avaliar_decodificacao(pasta_corpus, modelos=MODELOS_PADRAO, opcoes=None, saida="output", modos=MODOS):
+    """Avalia a grade modelos × opções × modos; retorna lista de resultados"""
+    print("="*70)
+    print("📐 AVALIAÇÃO VELOCIDADE × PRECISÃO")
+    print("="*70)
+    print()
+
+    if not os.path.isdir(pasta_corpus):
+        print(f"❌ Pasta não encontrada: {pasta_corpus}")
+        return None
+
+    try:
+        import torch
+        import whisper
+    except ImportError as e:
+        print(f"❌ Dependência não instalada: {e.name}")
+        return None
+
+    opcoes = opcoes or list(GRADE_OPCOES)
+    corpus = listar_corpus(pasta_corpus)
+    if not corpus:
+        print("❌ Nenhum par áudio + .txt encontrado")
+        return None
+
+    tem_gpu = torch.cuda.is_available()
+    print(f"📁 Corpus: {len(corpus)} arquivo(s)")
+    print(f"🤖 Modelos: {', '.join(modelos)}")
+    print(f"🎛️  Opções: {', '.join(opcoes)}")
+    print(f"✂️  Modos: {', '.join(modos)}")
+    print(f"💻 {'GPU' if tem_gpu else 'CPU'}")
+    print()
+
+    # Decodifica cada áudio uma única vez (fora da medição de RTF)
+    audios = []
+    for caminho, referencia in corpus:
+        audio = whisper.load_audio(caminho)
+        audios.append((caminho, audio, len(audio) / whisper.audio.SAMPLE_RATE, referencia))
+    duracao_total = sum(a[2] for a in audios)
+    print(f"⏱️  Duração total: {duracao_total/60:.1f} min")
+    print()
+
+    # Referências normalizadas (palavras e caracteres)
+    refs = [normalizar_avaliacao(a[3]) for a in audios]
+    ref_palavras = sum(len(r.split()) for r in refs)
+    ref_chars = sum(len(r) for r in refs)
+
+    resultados = []
+    for modelo in modelos:
+        print(f"📥 Carregando {modelo}...")
+        model = whisper.load_model(modelo, device="cuda" if tem_gpu else None)
+
+        for nome_opcao, modo in ((o, m) for o in opcoes for m in modos):
+            erros = {'wer_bruto': 0, 'wer_limpo': 0, 'cer_bruto': 0, 'cer_limpo': 0}
+            tempo = 0.0
+
+            for (caminho, audio, duracao, _), ref in zip(audios, refs):
+                inicio = time.perf_counter()
+                texto = transcrever_audio(model, audio, GRADE_OPCOES[nome_opcao], modo, tem_gpu)
+                tempo += time.perf_counter() - inicio
+
+                bruto = normalizar_avaliacao(texto)
+                limpo = normalizar_avaliacao(limpar_texto(texto))
+                erros['wer_bruto'] += distancia_edicao(ref.split(), bruto.split())
+                erros['wer_limpo'] += distancia_edicao(ref.split(), limpo.split())
+                erros['cer_bruto'] += distancia_edicao(ref, bruto)
+                erros['cer_limpo'] += distancia_edicao(ref, limpo)
+
+            r = {
+                'modelo': modelo,
+                'opcoes': nome_opcao,
+                'modo': modo,
+                'wer_bruto': erros['wer_bruto'] / max(ref_palavras, 1),
+                'wer_limpo': erros['wer_limpo'] / max(ref_palavras, 1),
+                'cer_bruto': erros['cer_bruto'] / max(ref_chars, 1),
+                'cer_limpo': erros['cer_limpo'] / max(ref_chars, 1),
+                'rtf': tempo / max(duracao_total, 1e-9),
+            }
+            resultados.append(r)
+            print(f"   {modelo:<8} {nome_opcao:<15} {modo:<10} WER {r['wer_limpo']:6.1%}  RTF {r['rtf']:.3f}")
+
+        del model
+        if tem_gpu:
+            torch.cuda.empty_cache()
+
+    # Os modos correspondem a caminhos diferentes do pipeline: uma fronteira por modo
+    for modo in modos:
+        _fronteira_pareto([r for r in resultados if r['modo'] == modo])
+    resultados.sort(key=lambda r: (MODOS.index(r['modo']), r['rtf']))
+
+    # Tabela
+    print()
+    print("="*70)
+    print("📊 RESULTADOS (⭐ = fronteira de Pareto RTF × WER limpo, por modo)")
+    print("="*70)
+    print(f"   {'modelo':<8} {'opções':<15} {'modo':<10} {'RTF':>6} {'WER':>7} {'WER*':>7} {'CER':>7} {'CER*':>7}")
+    modo_ant = None
+    for r in resultados:
+        if modo_ant is not None and r['modo'] != modo_ant:
+            print("   " + "-"*67)
+        modo_ant = r['modo']
+        marca = "⭐" if r['pareto'] else "  "
+        print(f"{marca} {r['modelo']:<8} {r['opcoes']:<15} {r['modo']:<10} {r['rtf']:6.3f} "
+              f"{r['wer_bruto']:7.1%} {r['wer_limpo']:7.1%} {r['cer_bruto']:7.1%} {r['cer_limpo']:7.1%}")
+    print("   (* = após limpar_profissional)")
+    print("   (modo completo = caminho --sem-pyannote; segmentos ≈ caminho com PyAnnote)")
+
+    # CSV
+    os.makedirs(saida, exist_ok=True)
+    arquivo_csv = os.path.join(saida, "avaliacao_decodificacao.csv")
+    with open(arquivo_csv, 'w', encoding='utf-8', newline='') as f:
+        campos = ['modelo', 'opcoes', 'modo', 'rtf', 'wer_bruto', 'wer_limpo', 'cer_bruto', 'cer_limpo', 'pareto']
+        writer = csv.DictWriter(f, fieldnames=campos)
+        writer.writeheader()
+        writer.writerows(resultados)
+
+    print()
+    print(f"📄 {arquivo_csv}")
+    print("="*70)
+
+    return resultados
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("="*70)
+        print("📐 AVALIAÇÃO VELOCIDADE × PRECISÃO")
+        print("="*70)
+        print("\nUso: python avaliar_decodificacao.py <pasta_corpus> [opções]")
+        print("\nA pasta deve ter pares áudio + referência: aula1.mp3 + aula1.txt")
+        print("\nOpções:")
+        print(f"  --modelos LISTA    - Modelos a testar (padrão: {','.join(MODELOS_PADRAO)})")
+        print(f"  --opcoes LISTA     - Opções de decodificação: {','.join(GRADE_OPCOES)} (padrão: todas)")
+        print(f"  --modos LISTA      - {','.join(MODOS)} (padrão: ambos)")
+        print("                       completo = caminho --sem-pyannote; segmentos = trechos")
+        print(f"                       isolados de {JANELA_SEGUNDOS:.0f}s, aproximando o caminho com PyAnnote")
+        print("  --saida PASTA      - Pasta do CSV (padrão: output)")
+        print("\nExemplos:")
+        print('  python avaliar_decodificacao.py corpus/')
+        print('  python avaliar_decodificacao.py corpus/ --modelos small,medium --opcoes atual,beam5')
+        sys.exit(1)
+
+    pasta = sys.argv[1].strip('"\'')
+    modelos = MODELOS_PADRAO
+    opcoes = None
+    saida = "output"
+    modos = MODOS
+
+    i = 2
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg == '--modelos' and i + 1 < len(sys.argv):
+            modelos = tuple(m.strip() for m in sys.argv[i + 1].split(',') if m.strip())
+            i += 1
+        elif arg == '--opcoes' and i + 1 < len(sys.argv):
+            opcoes = [o.strip() for o in sys.argv[i + 1].split(',') if o.strip()]
+            invalidas = [o for o in opcoes if o not in GRADE_OPCOES]
+            if invalidas:
+                print(f"❌ Opção(ões) inválida(s): {', '.join(invalidas)} (use: {', '.join(GRADE_OPCOES)})")
+                sys.exit(1)
+            i += 1
+        elif arg == '--modos' and i + 1 < len(sys.argv):
+            modos = tuple(m.strip() for m in sys.argv[i + 1].split(',') if m.strip())
+            invalidos = [m for m in modos if m not in MODOS]
+            if invalidos:
+                print(f"❌ Modo(s) inválido(s): {', '.join(invalidos)} (use: {', '.join(MODOS)})")
+                sys.exit(1)
+            i += 1
+        elif arg == '--saida' and i + 1 < len(sys.argv):
+            saida = sys.argv[i + 1].strip('"\'')
+            i += 1
+        i += 1
+
+    avaliar_decodificacao(pasta, modelos, opcoes, saida, modos)
@@ -0,0 +1,130 @@
+"""
+BENCHMARK SEGMENTOS - Tempo e memória da extração + agrupamento
+
+Gera uma transcrição bruta sintética (padrão: 10 horas) com monólogos
+longos e compara:
+  - legado: segmentos em dict, texto montado com += (quadrático)
+  - atual:  Segmento com __slots__, texto unido com ' '.join (linear)
+"""
+import sys
+import os
+import re
+import time
+import random
+import tempfile
+import tracemalloc
+
+from limpar_profissional import extrair_segmentos
+from segmentos import agrupar_por_speaker
+
+PALAVRAS = (
+    "a ideia do projeto é validar o protótipo com a cooperativa antes do piloto "
+    "e mostrar o retorno do investimento para a banca na mentoria de amanhã"
+).split()
+
+def gerar_transcricao(caminho, horas=10, seed=42):
+    """Escreve um _transcricao_bruta.txt sintético; retorna o número de segmentos"""
+    rnd = random.Random(seed)
+    total = int(horas * 3600)
+    t = 0
+    n = 0
+    speaker = 1
+    with open(caminho, 'w', encoding='utf-8') as f:
+        f.write("="*70 + "\n")
+        f.write("TRANSCRIÇÃO BRUTA\n")
+        f.write("="*70 + "\n\n")
+        while t < total:
+            # Monólogos longos: troca de speaker só a cada ~40 segmentos
+            if rnd.random() < 0.025:
+                speaker = rnd.randint(1, 4)
+            texto = ' '.join(rnd.choice(PALAVRAS) for _ in range(rnd.randint(8, 30)))
+            f.write(f"[{t // 3600}:{t % 3600 // 60:02d}:{t % 60:02d}] Speaker {speaker}:\n")
+            f.write(f"{texto}\n\n")
+            t += rnd.randint(3, 9)
+            n += 1
+    return n
+
+def _legado(arquivo):
+    """Implementação anterior (dicts + concatenação com +=)"""
+    with open(arquivo, 'r', encoding='utf-8') as f:
+        linhas = f.readlines()
+
+    segmentos = []
+    seg_atual = None
+    dentro = False
+    for linha in linhas:
+        l = linha.strip()
+        if 'TRANSCRIÇÃO' in l:
+            dentro = True
+            continue
+        if not dentro or not l or l.startswith('='):
+            continue
+        match = re.match(r'\[(\d{1,2}):(\d{2}):(\d{2})\]\s+(Speaker\s+\d+):', l)
+        if match:
+            if seg_atual and seg_atual['text'].strip():
+                segmentos.append(seg_atual)
+            h, m, s, speaker = match.groups()
+            seg_atual = {'start': int(h)*3600 + int(m)*60 + int(s), 'speaker': speaker, 'text': ''}
+        elif seg_atual:
+            seg_atual['text'] += ' ' + l
+    if seg_atual and seg_atual['text'].strip():
+        segmentos.append(seg_atual)
+
+    agrupados = []
+    if segmentos:
+        grupo = dict(segmentos[0])
+        for s in segmentos[1:]:
+            if s['speaker'] == grupo['speaker']:
+                grupo['text'] += ' ' + s['text']
+            else:
+                agrupados.append(grupo)
+                grupo = dict(s)
+        agrupados.append(grupo)
+    return segmentos, agrupados
+
+def _atual(arquivo):
+    segmentos = extrair_segmentos(arquivo)
+    return segmentos, agrupar_por_speaker(segmentos)
+
+def medir(funcao, arquivo):
+    """Retorna (segundos, pico de memória em MB, nº de grupos)"""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcao(arquivo)
+    tempo = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tempo, pico / (1024 * 1024), len(resultado[1])
+
+def benchmark(horas=10):
+    print("="*70)
+    print("📏 BENCHMARK SEGMENTOS")
+    print("="*70)
+
+    pasta = tempfile.mkdtemp(prefix="bench_segmentos_")
+    arquivo = os.path.join(pasta, "sintetico_transcricao_bruta.txt")
+    try:
+        n = gerar_transcricao(arquivo, horas)
+        tamanho_mb = os.path.getsize(arquivo) / (1024 * 1024)
+        print(f"📁 {horas}h sintéticas: {n:,} segmentos, {tamanho_mb:.1f} MB")
+        print()
+
+        resultados = {}
+        for nome, funcao in (("legado", _legado), ("atual", _atual)):
+            resultados[nome] = medir(funcao, arquivo)
+            tempo, pico, grupos = resultados[nome]
+            print(f"   {nome:<8} {tempo:7.3f}s   pico {pico:7.1f} MB   {grupos:,} grupos")
+
+        print()
+        leg, atu = resultados["legado"], resultados["atual"]
+        print(f"⚡ {leg[0] / atu[0]:.1f}x mais rápido, {leg[1] / atu[1]:.1f}x menos memória")
+        print("="*70)
+    finally:
+        os.remove(arquivo)
+        os.rmdir(pasta)
+
+    return resultados
+
+if __name__ == "__main__":
+    horas = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    benchmark(horas)
@@ -0,0 +1,97 @@
+"""
+BUSCAR TRANSCRIÇÕES - Consulta o índice e mostra onde cada termo foi dito
+
+Todos os termos da consulta precisam aparecer no mesmo segmento. A
+consulta passa pela mesma normalização do índice (NORMALIZE_TERMOS),
+então "chat gpt", "chat IPT" e "ChatGPT" encontram os mesmos trechos.
+"""
+import sys
+import os
+import time
+
+from indexar_transcricoes import ARQUIVO_INDICE, abrir_indice, tokenizar
+
+def formatar_timestamp(segundos):
+    h = int(segundos // 3600)
+    m = int((segundos % 3600) // 60)
+    s = int(segundos % 60)
+    return f"{h}:{m:02d}:{s:02d}"
+
+def buscar(consulta, pasta="output", limite=50):
+    """Retorna lista de (arquivo, timestamp_segundos, speaker, texto)"""
+    termos = sorted(set(tokenizar(consulta)))
+    if not termos:
+        return []
+
+    conn = abrir_indice(pasta)
+    try:
+        intersecao = " INTERSECT ".join(
+            ["SELECT segmento_id FROM postings WHERE termo = ?"] * len(termos)
+        )
+        return conn.execute(
+            f"""
+            SELECT a.caminho, s.inicio, s.speaker, s.texto
+            FROM segmentos s JOIN arquivos a ON a.id = s.arquivo_id
+            WHERE s.id IN ({intersecao})
+            ORDER BY a.caminho, s.inicio
+            LIMIT ?
+            """,
+            (*termos, limite)
+        ).fetchall()
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python buscar_transcricoes.py <consulta> [opções]")
+        print("\nOpções:")
+        print("  --pasta PASTA      - Pasta indexada (padrão: output)")
+        print("  --limite N         - Máximo de resultados (padrão: 50)")
+        print("\nExemplos:")
+        print('  python buscar_transcricoes.py "chat gpt"')
+        print('  python buscar_transcricoes.py "pré-pitch investidor" --limite 10')
+        print("\n💡 Atualize o índice antes com:")
+        print("   python indexar_transcricoes.py")
+        sys.exit(1)
+
+    consulta = sys.argv[1]
+    pasta = "output"
+    limite = 50
+
+    i = 2
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg == '--pasta' and i + 1 < len(sys.argv):
+            pasta = sys.argv[i + 1].strip('"\'')
+            i += 1
+        elif arg == '--limite' and i + 1 < len(sys.argv):
+            try:
+                limite = int(sys.argv[i + 1])
+            except ValueError:
+                limite = 0
+            if limite < 1:
+                print(f"❌ --limite deve ser um inteiro ≥ 1: {sys.argv[i + 1]}")
+                sys.exit(1)
+            i += 1
+        i += 1
+
+    if not os.path.exists(os.path.join(pasta, ARQUIVO_INDICE)):
+        print(f"❌ Índice não encontrado em {pasta}")
+        print("   Rode antes: python indexar_transcricoes.py")
+        sys.exit(1)
+
+    inicio = time.perf_counter()
+    resultados = buscar(consulta, pasta, limite)
+    tempo_ms = (time.perf_counter() - inicio) * 1000
+
+    print(f"🔍 \"{consulta}\" → {' '.join(tokenizar(consulta))}")
+    print(f"   {len(resultados)} resultado(s) em {tempo_ms:.1f} ms")
+    print()
+
+    arquivo_ant = None
+    for caminho, inicio_seg, speaker, texto in resultados:
+        if caminho != arquivo_ant:
+            print(f"📄 {os.path.basename(caminho)}")
+            arquivo_ant = caminho
+        trecho = texto if len(texto) <= 120 else texto[:117] + "..."
+        print(f"   [{formatar_timestamp(inicio_seg)}] {speaker}: {trecho}")
@@ -0,0 +1,118 @@
+"""
+FORMATOS DE SAÍDA - Escreve SRT, VTT, JSON e TXT em uma única passada
+
+Recebe a lista de Segmento (segmentos.py) em memória e grava todos os
+formatos pedidos ao mesmo tempo, com escrita bufferizada, preservando os
+tempos finais reais e o tempo de cada palavra (JSON).
+"""
+import os
+import json
+
+FORMATOS = ('srt', 'vtt', 'json', 'txt')
+
+# Buffer de escrita por arquivo
+TAMANHO_BUFFER = 1 << 16
+
+def _tempo(segundos, separador):
+    """Formata como HH:MM:SS<sep>mmm (SRT usa ',', VTT usa '.')"""
+    ms = int(round(segundos * 1000))
+    h, ms = divmod(ms, 3600000)
+    m, ms = divmod(ms, 60000)
+    s, ms = divmod(ms, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d}{separador}{ms:03d}"
+
+def _tempo_curto(segundos):
+    """Formata como H:MM:SS (mesmo formato dos arquivos TXT do projeto)"""
+    h = int(segundos // 3600)
+    m = int((segundos % 3600) // 60)
+    s = int(segundos % 60)
+    return f"{h}:{m:02d}:{s:02d}"
+
+# Cada formato: (cabeçalho, segmento, rodapé)
+
+def _srt_segmento(i, seg):
+    return (
+        f"{i}\n"
+        f"{_tempo(seg.start, ',')} --> {_tempo(seg.end, ',')}\n"
+        f"{seg.speaker}: {seg.text}\n\n"
+    )
+
+def _vtt_escapar(texto):
+    """Escapa texto de cue WebVTT (& e <; '-->' é proibido no payload)"""
+    return texto.replace('&', '&amp;').replace('<', '&lt;').replace('-->', '→')
+
+def _vtt_segmento(i, seg):
+    # A anotação de <v ...> termina no primeiro '>'
+    speaker = _vtt_escapar(seg.speaker).replace('>', '&gt;')
+    return (
+        f"{_tempo(seg.start, '.')} --> {_tempo(seg.end, '.')}\n"
+        f"<v {speaker}>{_vtt_escapar(seg.text)}\n\n"
+    )
+
+def _json_segmento(i, seg):
+    item = {
+        'id': i,
+        'start': round(seg.start, 3),
+        'end': round(seg.end, 3),
+        'speaker': seg.speaker,
+        'text': seg.text,
+    }
+    if seg.words:
+        item['words'] = [
+            {'word': w['word'].strip(), 'start': round(w['start'], 3), 'end': round(w['end'], 3)}
+            for w in seg.words
+        ]
+    separador = ",\n    " if i > 1 else "\n    "
+    return separador + json.dumps(item, ensure_ascii=False)
+
+def _txt_segmento(i, seg):
+    return f"[{_tempo_curto(seg.start)} - {_tempo_curto(seg.end)}] {seg.speaker}: {seg.text}\n"
+
+def _json_cabecalho(metadados):
+    meta = json.dumps(metadados or {}, ensure_ascii=False)
+    return f'{{\n  "metadados": {meta},\n  "segmentos": ['
+
+_ESCRITORES = {
+    'srt': (lambda meta: "", _srt_segmento, ""),
+    'vtt': (lambda meta: "WEBVTT\n\n", _vtt_segmento, ""),
+    'json': (_json_cabecalho, _json_segmento, "\n  ]\n}\n"),
+    'txt': (lambda meta: "", _txt_segmento, ""),
+}
+
+def parse_formatos(texto):
+    """Converte 'srt,vtt,json' em tupla validada de formatos"""
+    formatos = tuple(f.strip().lower() for f in texto.split(',') if f.strip())
+    invalidos = [f for f in formatos if f not in FORMATOS]
+    if invalidos:
+        raise ValueError(f"Formato(s) inválido(s): {', '.join(invalidos)} (use: {', '.join(FORMATOS)})")
+    return formatos
+
+def escrever_saidas(segmentos, nome_base, formatos=FORMATOS, pasta="output", metadados=None):
+    """
+    Escreve todos os formatos pedidos em uma única passada pelos segmentos.
+    Retorna {formato: caminho}.
+    """
+    os.makedirs(pasta, exist_ok=True)
+
+    arquivos = {}
+    try:
+        for formato in dict.fromkeys(formatos):
+            caminho = os.path.join(pasta, f"{nome_base}.{formato}")
+            arquivos[formato] = open(caminho, 'w', encoding='utf-8', buffering=TAMANHO_BUFFER)
+
+        ativos = [(arquivos[fmt].write, _ESCRITORES[fmt][1]) for fmt in arquivos]
+
+        for fmt, f in arquivos.items():
+            f.write(_ESCRITORES[fmt][0](metadados))
+
+        for i, seg in enumerate(segmentos, 1):
+            for escrever, formatar in ativos:
+                escrever(formatar(i, seg))
+
+        for fmt, f in arquivos.items():
+            f.write(_ESCRITORES[fmt][2])
+    finally:
+        for f in arquivos.values():
+            f.close()
+
+    return {fmt: f.name for fmt, f in arquivos.items()}
@@ -0,0 +1,250 @@
+"""
+INDEXAR TRANSCRIÇÕES - Índice invertido (termo → arquivo, speaker, timestamp)
+
+Indexa cada transcrição limpa (*_PROFISSIONAL.txt) em nível de
+segmento. Se o *_transcricao_bruta.txt de origem existir, os textos vêm
+dos segmentos dele, passados por limpar_texto, de modo que cada
+ocorrência mantém o timestamp em que foi dita (o _PROFISSIONAL agrupa
+monólogos inteiros sob o primeiro timestamp). Sem o bruto, indexa os
+grupos do próprio _PROFISSIONAL com o timestamp de início de cada um.
+Os resultados apontam para o _PROFISSIONAL.
+
+O índice SQLite fica na pasta das transcrições limpas. A atualização é
+incremental: só arquivos novos ou alterados (mtime/tamanho do limpo e
+do bruto) são reindexados, e os removidos saem do índice.
+
+Termos passam pela mesma normalização de NORMALIZE_TERMOS, então
+variantes como "chat gpt" e "xatipt" caem no mesmo termo "chatgpt".
+"""
+import sys
+import os
+import re
+import time
+import sqlite3
+import unicodedata
+from pathlib import Path
+
+from dicionario_normalizacao import NORMALIZE_TERMOS
+from limpar_profissional import caminho_profissional, extrair_segmentos, limpar_texto
+
+ARQUIVO_INDICE = ".indice_transcricoes.sqlite"
+PADRAO_ARQUIVOS = "*_PROFISSIONAL.txt"
+
+# Incrementar quando o esquema mudar (o índice é recriado)
+VERSAO_ESQUEMA = 3
+
+# Uma única regex para todo o dicionário (variantes mais longas primeiro)
+_MAPA_TERMOS = {errado.lower(): correto for errado, correto in NORMALIZE_TERMOS.items()}
+_REGEX_TERMOS = re.compile(
+    r'\b(?:' + '|'.join(re.escape(t) for t in sorted(_MAPA_TERMOS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+_REGEX_PALAVRA = re.compile(r'\w+')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS arquivos (
+    id INTEGER PRIMARY KEY,
+    caminho TEXT UNIQUE NOT NULL,
+    bruto TEXT,
+    assinatura TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segmentos (
+    id INTEGER PRIMARY KEY,
+    arquivo_id INTEGER NOT NULL,
+    inicio INTEGER NOT NULL,
+    speaker TEXT NOT NULL,
+    texto TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_segmentos_arquivo ON segmentos(arquivo_id);
+CREATE TABLE IF NOT EXISTS postings (
+    termo TEXT NOT NULL,
+    segmento_id INTEGER NOT NULL,
+    PRIMARY KEY (termo, segmento_id)
+) WITHOUT ROWID;
+"""
+
+def normalizar_termos(texto):
+    """Aplica NORMALIZE_TERMOS (sem diferenciar maiúsculas)"""
+    return _REGEX_TERMOS.sub(lambda m: _MAPA_TERMOS[m.group(0).lower()], texto)
+
+def tokenizar(texto):
+    """Normaliza e quebra em termos: minúsculas, sem acentos"""
+    texto = normalizar_termos(texto).lower()
+    texto = unicodedata.normalize('NFKD', texto)
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return _REGEX_PALAVRA.findall(texto)
+
+def abrir_indice(pasta="output"):
+    """Abre (ou cria) o índice da pasta"""
+    conn = sqlite3.connect(os.path.join(pasta, ARQUIVO_INDICE))
+    if conn.execute("PRAGMA user_version").fetchone()[0] != VERSAO_ESQUEMA:
+        conn.executescript("""
+            DROP TABLE IF EXISTS postings;
+            DROP TABLE IF EXISTS segmentos;
+            DROP TABLE IF EXISTS arquivos;
+        """)
+        conn.execute(f"PRAGMA user_version = {VERSAO_ESQUEMA}")
+    conn.executescript(_SCHEMA)
+    return conn
+
+def _assinatura(profissional, bruto=None):
+    """mtime/tamanho do limpo (+ bruto, se houver; muda se qualquer um mudar)"""
+    a = os.stat(profissional)
+    assinatura = f"{a.st_mtime}:{a.st_size}"
+    if bruto:
+        b = os.stat(bruto)
+        assinatura += f":{b.st_mtime}:{b.st_size}"
+    return assinatura
+
+def caminho_bruto(profissional, pasta_brutos):
+    """Caminho do _transcricao_bruta.txt que originou um _PROFISSIONAL.txt"""
+    nome = Path(profissional).stem.replace('_PROFISSIONAL', '')
+    return os.path.join(pasta_brutos, f"{nome}_transcricao_bruta.txt")
+
+def _remover_arquivo(conn, arquivo_id):
+    conn.execute(
+        "DELETE FROM postings WHERE segmento_id IN (SELECT id FROM segmentos WHERE arquivo_id = ?)",
+        (arquivo_id,)
+    )
+    conn.execute("DELETE FROM segmentos WHERE arquivo_id = ?", (arquivo_id,))
+    conn.execute("DELETE FROM arquivos WHERE id = ?", (arquivo_id,))
+
+def indexar_arquivo(conn, profissional, bruto=None):
+    """
+    (Re)indexa um _PROFISSIONAL.txt em nível de segmento: com o bruto,
+    usa os segmentos originais (limpos); sem ele, os grupos do próprio
+    arquivo limpo. Retorna o número de segmentos indexados
+    """
+    profissional = os.path.abspath(profissional)
+    bruto = os.path.abspath(bruto) if bruto and os.path.exists(bruto) else None
+
+    linha = conn.execute("SELECT id FROM arquivos WHERE caminho = ?", (profissional,)).fetchone()
+    if linha:
+        _remover_arquivo(conn, linha[0])
+
+    arquivo_id = conn.execute(
+        "INSERT INTO arquivos (caminho, bruto, assinatura) VALUES (?, ?, ?)",
+        (profissional, bruto, _assinatura(profissional, bruto))
+    ).lastrowid
+
+    if bruto:
+        segs = extrair_segmentos(bruto)
+        textos = [limpar_texto(s.text) for s in segs]
+    else:
+        segs = extrair_segmentos(profissional)
+        textos = [' '.join(s.text.split()) for s in segs]
+
+    for s, texto in zip(segs, textos):
+        segmento_id = conn.execute(
+            "INSERT INTO segmentos (arquivo_id, inicio, speaker, texto) VALUES (?, ?, ?, ?)",
+            (arquivo_id, int(s.start), s.speaker, texto)
+        ).lastrowid
+        conn.executemany(
+            "INSERT OR IGNORE INTO postings (termo, segmento_id) VALUES (?, ?)",
+            ((termo, segmento_id) for termo in set(tokenizar(texto)))
+        )
+
+    return len(segs)
+
+def indexar_transcricoes(pasta="output", pasta_brutos=None):
+    """
+    Atualiza o índice incrementalmente; retorna (novos/alterados, removidos, inalterados)
+
+    pasta: onde estão os _PROFISSIONAL.txt (e o índice)
+    pasta_brutos: onde estão os _transcricao_bruta.txt (padrão: a mesma)
+    """
+    print("="*70)
+    print("🗂️  INDEXAÇÃO DE TRANSCRIÇÕES")
+    print("="*70)
+    print()
+
+    pasta_brutos = pasta_brutos or pasta
+    for p in (pasta, pasta_brutos):
+        if not os.path.isdir(p):
+            print(f"❌ Pasta não encontrada: {p}")
+            return None
+
+    inicio = time.time()
+    conn = abrir_indice(pasta)
+
+    try:
+        indexados = {
+            caminho: (arquivo_id, assinatura)
+            for arquivo_id, caminho, assinatura
+            in conn.execute("SELECT id, caminho, assinatura FROM arquivos")
+        }
+
+        # Cada limpo com o bruto de origem, quando ele existir
+        atuais = {}
+        for p in Path(pasta).glob(PADRAO_ARQUIVOS):
+            bruto = os.path.abspath(caminho_bruto(p, pasta_brutos))
+            atuais[str(p.resolve())] = bruto if os.path.exists(bruto) else None
+
+        alterados = 0
+        inalterados = 0
+        segmentos = 0
+        sem_bruto = sum(1 for bruto in atuais.values() if bruto is None)
+
+        for caminho in sorted(atuais):
+            bruto = atuais[caminho]
+            anterior = indexados.get(caminho)
+            if anterior and anterior[1] == _assinatura(caminho, bruto):
+                inalterados += 1
+                continue
+
+            segmentos += indexar_arquivo(conn, caminho, bruto)
+            alterados += 1
+            print(f"   + {os.path.basename(caminho)}")
+
+        # Remove limpos que sumiram (mesmo que indexados de outra pasta)
+        removidos = [
+            caminho for (caminho,) in conn.execute("SELECT caminho FROM arquivos")
+            if not os.path.exists(caminho)
+        ]
+        for caminho in removidos:
+            _remover_arquivo(conn, indexados[caminho][0])
+            print(f"   - {os.path.basename(caminho)}")
+
+        conn.commit()
+    finally:
+        conn.close()
+
+    print()
+    print(f"✓ {alterados} indexados ({segmentos} segmentos), "
+          f"{len(removidos)} removidos, {inalterados} inalterados")
+    if sem_bruto:
+        print(f"⚠️  {sem_bruto} sem _transcricao_bruta.txt (timestamps por grupo)")
+    print(f"⏱️  {time.time() - inicio:.2f}s")
+    print("="*70)
+
+    return alterados, len(removidos), inalterados
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+        print("Uso: python indexar_transcricoes.py [pasta] [--brutos PASTA]")
+        print("Indexa os *_PROFISSIONAL.txt da pasta (padrão: output), com o")
+        print("timestamp de cada segmento do _transcricao_bruta.txt de origem")
+        print("(sem ele, com o timestamp de cada grupo do _PROFISSIONAL)")
+        print("\nOpções:")
+        print("  --brutos PASTA     - Pasta dos _transcricao_bruta.txt (padrão: a mesma)")
+        print("\nDepois busque com:")
+        print('  python buscar_transcricoes.py "termo"')
+        sys.exit(1)
+
+    pasta = "output"
+    pasta_brutos = None
+    posicionais = []
+
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg == '--brutos' and i + 1 < len(sys.argv):
+            pasta_brutos = sys.argv[i + 1].strip('"\'')
+            i += 1
+        else:
+            posicionais.append(arg.strip('"\''))
+        i += 1
+    if posicionais:
+        pasta = posicionais[0]
+
+    indexar_transcricoes(pasta, pasta_brutos)
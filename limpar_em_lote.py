@@ -0,0 +1,210 @@
+"""
+LIMPEZA EM LOTE - Reprocessa um acervo de transcrições brutas em paralelo
+
+Percorre uma pasta atrás de *_transcricao_bruta.txt e distribui os
+arquivos num pool de processos. Cada worker compila as regras de
+limpeza uma única vez e as reutiliza em todos os arquivos que recebe.
+
+Arquivos cujo conteúdo e regras não mudaram desde a última execução
+são pulados (hashes guardados em <saida>/.limpeza_lote.json).
+
+As saídas são planas (<saida>/<nome>_PROFISSIONAL.txt): se dois brutos
+em subpastas diferentes gerarem o mesmo nome, o lote falha antes de
+começar em vez de um sobrescrever o outro.
+"""
+import sys
+import os
+import json
+import time
+import hashlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+import segmentos
+import limpar_profissional
+from limpar_profissional import caminho_profissional, compilar_regras, limpar_arquivo
+
+ARQUIVO_MANIFESTO = ".limpeza_lote.json"
+PADRAO_ARQUIVOS = "*_transcricao_bruta.txt"
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+_REGRAS_WORKER = None
+
+def _iniciar_worker():
+    """Compila as regras uma vez por processo do pool"""
+    global _REGRAS_WORKER
+    _REGRAS_WORKER = compilar_regras()
+
+def _limpar_worker(args):
+    arquivo, modo, pasta_saida = args
+    try:
+        saida, _ = limpar_arquivo(arquivo, modo, _REGRAS_WORKER, pasta_saida)
+        return arquivo, saida, None
+    except Exception as e:
+        return arquivo, None, str(e)
+
+def _hash_arquivo(caminho):
+    h = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+def hash_regras(modo):
+    """
+    Hash de tudo que altera o resultado da limpeza: o modo e o código-fonte
+    de limpar_profissional.py (regras, parser, formatação), segmentos.py
+    (agrupamento) e dicionario_normalizacao.py
+    """
+    h = hashlib.sha256()
+    h.update(modo.encode('utf-8'))
+    fontes = (
+        limpar_profissional.__file__,
+        segmentos.__file__,
+        os.path.join(PASTA, "dicionario_normalizacao.py"),
+    )
+    for fonte in fontes:
+        if os.path.exists(fonte):
+            h.update(_hash_arquivo(fonte).encode('utf-8'))
+    return h.hexdigest()
+
+def _carregar_manifesto(caminho):
+    try:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def limpar_em_lote(pasta, modo="agressivo", pasta_saida="output", workers=None, forcar=False):
+    """Limpa todos os arquivos brutos da pasta; retorna (processados, pulados, erros)"""
+    print("="*70)
+    print("🧹 LIMPEZA EM LOTE")
+    print("="*70)
+    print()
+
+    if not os.path.isdir(pasta):
+        print(f"❌ Pasta não encontrada: {pasta}")
+        return None
+
+    # Caminhos absolutos: o manifesto não pode depender do diretório atual
+    pasta_saida = os.path.abspath(pasta_saida)
+    os.makedirs(pasta_saida, exist_ok=True)
+    caminho_manifesto = os.path.join(pasta_saida, ARQUIVO_MANIFESTO)
+    manifesto = {} if forcar else _carregar_manifesto(caminho_manifesto)
+    regras = hash_regras(modo)
+
+    arquivos = sorted(str(p.resolve()) for p in Path(pasta).rglob(PADRAO_ARQUIVOS))
+    print(f"📁 {pasta}: {len(arquivos)} arquivos")
+    print(f"🔧 Modo: {modo}")
+
+    # Dois brutos com o mesmo nome gerariam o mesmo _PROFISSIONAL.txt
+    destinos = {}
+    for arquivo in arquivos:
+        destinos.setdefault(caminho_profissional(arquivo, pasta_saida), []).append(arquivo)
+    conflitos = {saida: origens for saida, origens in destinos.items() if len(origens) > 1}
+    if conflitos:
+        print()
+        print("❌ Arquivos com o mesmo nome em subpastas diferentes:")
+        for saida, origens in sorted(conflitos.items()):
+            print(f"   {os.path.basename(saida)} ←")
+            for origem in origens:
+                print(f"      {origem}")
+        print("   Renomeie os arquivos ou limpe cada subpasta com --saida própria.")
+        return None
+
+    pendentes = []
+    hashes = {}
+    for arquivo in arquivos:
+        fonte = _hash_arquivo(arquivo)
+        hashes[arquivo] = fonte
+        anterior = manifesto.get(arquivo)
+        if (anterior and anterior['fonte'] == fonte and anterior['regras'] == regras
+                and os.path.exists(anterior['saida'])):
+            continue
+        pendentes.append(arquivo)
+
+    pulados = len(arquivos) - len(pendentes)
+    print(f"⏭️  {pulados} inalterados, {len(pendentes)} para processar")
+    print()
+
+    erros = 0
+    processados = 0
+    bytes_processados = 0
+    inicio = time.time()
+
+    if pendentes:
+        workers = workers or os.cpu_count() or 1
+        workers = min(workers, len(pendentes))
+        chunksize = max(1, len(pendentes) // (workers * 4))
+        tarefas = [(arquivo, modo, pasta_saida) for arquivo in pendentes]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_iniciar_worker) as pool:
+            for arquivo, saida, erro in pool.map(_limpar_worker, tarefas, chunksize=chunksize):
+                if erro:
+                    erros += 1
+                    print(f"   ❌ {os.path.basename(arquivo)}: {erro}")
+                    continue
+                processados += 1
+                bytes_processados += os.path.getsize(arquivo)
+                manifesto[arquivo] = {'fonte': hashes[arquivo], 'regras': regras, 'saida': saida}
+
+        with open(caminho_manifesto, 'w', encoding='utf-8') as f:
+            json.dump(manifesto, f, ensure_ascii=False, indent=1)
+
+    tempo = max(time.time() - inicio, 1e-9)
+    mb = bytes_processados / (1024 * 1024)
+
+    print("="*70)
+    print("✅ LIMPEZA EM LOTE CONCLUÍDA")
+    print("="*70)
+    print(f"📊 {processados} processados, {pulados} pulados, {erros} erros")
+    if processados:
+        print(f"⚡ {processados / tempo:.1f} arquivos/s, {mb / tempo:.2f} MB/s ({tempo:.1f}s)")
+    print("="*70)
+
+    return processados, pulados, erros
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python limpar_em_lote.py <pasta> [opções]")
+        print("\nOpções:")
+        print("  [modo]             - leve, medio, agressivo (padrão: agressivo)")
+        print("  --saida PASTA      - Pasta dos _PROFISSIONAL.txt (padrão: output)")
+        print("  --workers N        - Processos paralelos (padrão: nº de CPUs)")
+        print("  --forcar           - Reprocessa mesmo arquivos inalterados")
+        print("\nExemplos:")
+        print('  python limpar_em_lote.py output')
+        print('  python limpar_em_lote.py acervo/ medio --workers 8')
+        sys.exit(1)
+
+    pasta = sys.argv[1].strip('"\'')
+    modo = "agressivo"
+    pasta_saida = "output"
+    workers = None
+    forcar = False
+
+    i = 2
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg in ['leve', 'medio', 'agressivo']:
+            modo = arg
+        elif arg == '--saida' and i + 1 < len(sys.argv):
+            pasta_saida = sys.argv[i + 1].strip('"\'')
+            i += 1
+        elif arg == '--workers' and i + 1 < len(sys.argv):
+            try:
+                workers = int(sys.argv[i + 1])
+            except ValueError:
+                workers = 0
+            if workers < 1:
+                print(f"❌ --workers deve ser um inteiro ≥ 1: {sys.argv[i + 1]}")
+                sys.exit(1)
+            i += 1
+        elif arg == '--forcar':
+            forcar = True
+        i += 1
+
+    resultado = limpar_em_lote(pasta, modo, pasta_saida, workers, forcar)
+    if resultado is None or resultado[2]:
+        sys.exit(1)
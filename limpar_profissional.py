@@ -7,6 +7,8 @@ import os
 import re
 from pathlib import Path
 
+from segmentos import Segmento, agrupar_por_speaker
+
 # Dicionário completo
 NORMALIZE = {
     "chat IPT": "ChatGPT", "chat ipt": "ChatGPT", "chatgpt": "ChatGPT",
@@ -27,58 +29,157 @@ VICIOS_AGRESSIVO = [
     r'\bah\b', r'\boh\b', r'\beh\b', r'\buh\b',
 ]
 
+def compilar_regras():
+    """
+    Pré-compila normalização e vícios
+    Retorna (normalizacao, vicios) - compile uma vez e reutilize por processo
+    """
+    normalizacao = tuple(
+        (re.compile(re.escape(errado), re.IGNORECASE), correto)
+        for errado, correto in NORMALIZE.items()
+    )
+    vicios = tuple(re.compile(vicio, re.IGNORECASE) for vicio in VICIOS_AGRESSIVO)
+    return normalizacao, vicios
+
+_REGRAS = None
+
+def regras_padrao():
+    """Regras compiladas do processo atual (compiladas no primeiro uso)"""
+    global _REGRAS
+    if _REGRAS is None:
+        _REGRAS = compilar_regras()
+    return _REGRAS
+
+def normalizar_texto(texto, regras):
+    for padrao, correto in regras[0]:
+        texto = padrao.sub(correto, texto)
+    return texto
+
+def remover_vicios(texto, regras):
+    for padrao in regras[1]:
+        texto = padrao.sub('', texto)
+    return texto
+
+def finalizar_texto(texto):
+    """Remove espaços múltiplos, capitaliza e garante ponto final"""
+    texto = ' '.join(texto.split())
+    if texto:
+        texto = texto[0].upper() + texto[1:]
+    if texto and texto[-1] not in '.!?':
+        texto += '.'
+    return texto
+
+def limpar_texto(texto, regras=None):
+    """Aplica normalização, remoção de vícios e limpeza a um texto solto"""
+    regras = regras or regras_padrao()
+    return finalizar_texto(remover_vicios(normalizar_texto(texto, regras), regras))
+
 def formatar_timestamp(segundos):
     h = int(segundos // 3600)
     m = int((segundos % 3600) // 60)
     s = int(segundos % 60)
     return f"[{h}:{m:02d}:{s:02d}]"
 
+# [H:MM:SS] Speaker N: / SPEAKER_00: / nome de voz conhecida:
+_REGEX_CABECALHO = re.compile(r'\[(\d{1,2}):(\d{2}):(\d{2})\]\s+([^:]+?):\s*$')
+
 def extrair_segmentos(arquivo):
-    """Extrai segmentos do arquivo bruto"""
-    with open(arquivo, 'r', encoding='utf-8') as f:
-        linhas = f.readlines()
-    
+    """
+    Extrai segmentos do arquivo bruto
+    O TXT só guarda o início; o fim de cada segmento é o início do próximo.
+    """
     segmentos = []
-    seg_atual = None
+    cabecalho = None
+    partes = []
     dentro = False
     
-    for linha in linhas:
-        l = linha.strip()
-        
-        # Detecta início
-        if 'TRANSCRIÇÃO' in l:
-            dentro = True
-            continue
-        
-        if not dentro or not l or l.startswith('='):
-            continue
-        
-        # Detecta [H:MM:SS] Speaker N:
-        match = re.match(r'\[(\d{1,2}):(\d{2}):(\d{2})\]\s+(Speaker\s+\d+):', l)
-        
-        if match:
-            # Salva anterior
-            if seg_atual and seg_atual['text'].strip():
-                segmentos.append(seg_atual)
+    def fechar():
+        texto = ' '.join(partes)
+        if texto.strip():
+            start, speaker = cabecalho
+            segmentos.append(Segmento(start, start, speaker, texto))
+    
+    with open(arquivo, 'r', encoding='utf-8') as f:
+        for linha in f:
+            l = linha.strip()
             
-            # Novo segmento
-            h, m, s, speaker = match.groups()
-            seg_atual = {
-                'start': int(h)*3600 + int(m)*60 + int(s),
-                'speaker': speaker,
-                'text': ''
-            }
-        elif seg_atual:
-            # Adiciona texto
-            seg_atual['text'] += ' ' + l
+            # Detecta início
+            if 'TRANSCRIÇÃO' in l:
+                dentro = True
+                continue
+            
+            # Ignora cabeçalhos e separadores (---- entre speakers no _PROFISSIONAL)
+            if not dentro or not l or l.startswith('=') or l.startswith('---'):
+                continue
+            
+            # Detecta [H:MM:SS] Speaker:
+            match = _REGEX_CABECALHO.match(l)
+            
+            if match:
+                # Salva anterior
+                if cabecalho:
+                    fechar()
+                
+                # Novo segmento
+                h, m, s, speaker = match.groups()
+                cabecalho = (int(h)*3600 + int(m)*60 + int(s), speaker)
+                partes = []
+            elif cabecalho:
+                # Acumula texto (unido uma vez ao fechar o segmento)
+                partes.append(l)
     
     # Último segmento
-    if seg_atual and seg_atual['text'].strip():
-        segmentos.append(seg_atual)
+    if cabecalho:
+        fechar()
+    
+    for atual, proximo in zip(segmentos, segmentos[1:]):
+        atual.end = proximo.start
     
     return segmentos
 
-def limpar_profissional(arquivo, modo="agressivo"):
+def caminho_profissional(arquivo, pasta_saida="output"):
+    """Caminho do _PROFISSIONAL.txt gerado a partir de um arquivo bruto"""
+    nome = Path(arquivo).stem.replace('_transcricao_bruta', '').replace('_limpo', '')
+    return os.path.join(pasta_saida, f"{nome}_PROFISSIONAL.txt")
+
+def salvar_profissional(segs, arquivo, modo, pasta_saida="output"):
+    """Grava o _PROFISSIONAL.txt; retorna o caminho"""
+    saida = caminho_profissional(arquivo, pasta_saida)
+    
+    with open(saida, 'w', encoding='utf-8') as f:
+        f.write("="*70 + "\n")
+        f.write("✨ TRANSCRIÇÃO PROFISSIONAL\n")
+        f.write("="*70 + "\n\n")
+        f.write(f"📁 Origem: {os.path.basename(arquivo)}\n")
+        f.write(f"🔧 Limpeza: {modo}\n")
+        f.write(f"📊 Segmentos: {len(segs)}\n")
+        f.write(f"🎤 Speakers: {len(set(s.speaker for s in segs))}\n")
+        f.write("\n" + "="*70 + "\n")
+        f.write("TRANSCRIÇÃO\n")
+        f.write("="*70 + "\n\n")
+        
+        speaker_ant = None
+        for s in segs:
+            if speaker_ant and speaker_ant != s.speaker:
+                f.write("\n" + "-"*70 + "\n\n")
+            
+            f.write(f"{formatar_timestamp(s.start)} {s.speaker}:\n")
+            f.write(f"{s.text}\n\n")
+            
+            speaker_ant = s.speaker
+    
+    return saida
+
+def limpar_arquivo(arquivo, modo="agressivo", regras=None, pasta_saida="output"):
+    """Limpeza completa sem saída no console (usada em lote); retorna (saida, segmentos)"""
+    regras = regras or regras_padrao()
+    segs = extrair_segmentos(arquivo)
+    for s in segs:
+        s.text = limpar_texto(s.text, regras)
+    segs = agrupar_por_speaker(segs)
+    return salvar_profissional(segs, arquivo, modo, pasta_saida), len(segs)
+
+def limpar_profissional(arquivo, modo="agressivo", pasta_saida="output"):
     """Limpeza profissional completa"""
     print("="*70)
     print("✨ LIMPEZA PROFISSIONAL")
@@ -103,80 +204,38 @@ def limpar_profissional(arquivo, modo="agressivo"):
     print("🔧 Processando...")
     
     # 1. Normaliza termos
+    regras = regras_padrao()
     print("   1. Normalizando termos...")
     for s in segs:
-        for errado, correto in NORMALIZE.items():
-            s['text'] = re.sub(re.escape(errado), correto, s['text'], flags=re.IGNORECASE)
+        s.text = normalizar_texto(s.text, regras)
     
     # 2. Remove vícios
     print(f"   2. Removendo vícios ({modo})...")
     for s in segs:
-        for vicio in VICIOS_AGRESSIVO:
-            s['text'] = re.sub(vicio, '', s['text'], flags=re.IGNORECASE)
+        s.text = remover_vicios(s.text, regras)
     
     # 3. Limpa
     print("   3. Limpando texto...")
     for s in segs:
-        # Remove espaços múltiplos
-        s['text'] = ' '.join(s['text'].split())
-        # Capitaliza
-        if s['text']:
-            s['text'] = s['text'][0].upper() + s['text'][1:]
-        # Adiciona ponto final
-        if s['text'] and s['text'][-1] not in '.!?':
-            s['text'] += '.'
+        s.text = finalizar_texto(s.text)
     
     # 4. Agrupa speakers consecutivos
     print("   4. Agrupando speakers...")
-    agrupados = []
-    if segs:
-        grupo = {'start': segs[0]['start'], 'speaker': segs[0]['speaker'], 'text': segs[0]['text']}
-        
-        for s in segs[1:]:
-            if s['speaker'] == grupo['speaker']:
-                grupo['text'] += ' ' + s['text']
-            else:
-                agrupados.append(grupo)
-                grupo = {'start': s['start'], 'speaker': s['speaker'], 'text': s['text']}
-        
-        agrupados.append(grupo)
+    agrupados = agrupar_por_speaker(segs)
     
     segs = agrupados
     print(f"✓ {len(segs)} segmentos finais")
     print()
     
     # Salva
-    nome = Path(arquivo).stem.replace('_transcricao_bruta', '').replace('_limpo', '')
-    saida = f"output/{nome}_PROFISSIONAL.txt"
-    
-    with open(saida, 'w', encoding='utf-8') as f:
-        f.write("="*70 + "\n")
-        f.write("✨ TRANSCRIÇÃO PROFISSIONAL\n")
-        f.write("="*70 + "\n\n")
-        f.write(f"📁 Origem: {os.path.basename(arquivo)}\n")
-        f.write(f"🔧 Limpeza: {modo}\n")
-        f.write(f"📊 Segmentos: {len(segs)}\n")
-        f.write(f"🎤 Speakers: {len(set(s['speaker'] for s in segs))}\n")
-        f.write("\n" + "="*70 + "\n")
-        f.write("TRANSCRIÇÃO\n")
-        f.write("="*70 + "\n\n")
-        
-        speaker_ant = None
-        for s in segs:
-            if speaker_ant and speaker_ant != s['speaker']:
-                f.write("\n" + "-"*70 + "\n\n")
-            
-            f.write(f"{formatar_timestamp(s['start'])} {s['speaker']}:\n")
-            f.write(f"{s['text']}\n\n")
-            
-            speaker_ant = s['speaker']
+    saida = salvar_profissional(segs, arquivo, modo, pasta_saida)
     
     print("="*70)
     print("✅ LIMPEZA CONCLUÍDA")
     print("="*70)
     print(f"📄 {saida}")
     print(f"📊 {len(segs)} segmentos")
-    print(f"🎤 {len(set(s['speaker'] for s in segs))} speakers")
+    print(f"🎤 {len(set(s.speaker for s in segs))} speakers")
     print("="*70)
     
     return saida
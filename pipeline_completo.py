@@ -1,9 +1,10 @@
 """
 PIPELINE COMPLETO - Transcrição profissional em um comando
+
+A etapa de transcrição (whisper/torch) só é importada quando vai rodar.
 """
 import sys
 import os
-from transcrever_profissional import transcrever_profissional
 from limpar_profissional import limpar_profissional
 
 def pipeline_completo(
@@ -11,18 +12,25 @@ def pipeline_completo(
     modelo: str = "small",
     usar_pyannote: bool = True,
     hf_token: str = None,
-    modo_limpeza: str = "medio"
+    modo_limpeza: str = "medio",
+    apenas_limpeza: bool = False,
+    formatos: tuple = (),
+    arquivo_vozes: str = "vozes/vozes.npz"
 ):
     """
     Pipeline completo: transcrição + pós-processamento
+    
+    Com apenas_limpeza=True, caminho_video é uma transcrição bruta já
+    existente e só a etapa de limpeza é executada.
     """
     print("="*70)
     print("🚀 PIPELINE COMPLETO")
     print("="*70)
     print()
     print(f"📁 Arquivo: {os.path.basename(caminho_video)}")
-    print(f"🤖 Modelo: {modelo}")
-    print(f"🎤 PyAnnote: {'Sim' if usar_pyannote else 'Não'}")
+    if not apenas_limpeza:
+        print(f"🤖 Modelo: {modelo}")
+        print(f"🎤 PyAnnote: {'Sim' if usar_pyannote else 'Não'}")
     print(f"🔧 Limpeza: {modo_limpeza}")
     print()
     print("="*70)
@@ -32,12 +40,22 @@ def pipeline_completo(
     print("📍 ETAPA 1/2: TRANSCRIÇÃO")
     print()
     
-    arquivo_bruto = transcrever_profissional(
-        caminho_video,
-        modelo=modelo,
-        usar_pyannote=usar_pyannote,
-        hf_token=hf_token
-    )
+    if apenas_limpeza:
+        print("⏭️  Pulada (--apenas-limpeza)")
+        if formatos:
+            print("⚠️  --formatos não tem efeito com --apenas-limpeza (os formatos saem da transcrição)")
+        arquivo_bruto = caminho_video
+    else:
+        from transcrever_profissional import transcrever_profissional
+        
+        arquivo_bruto = transcrever_profissional(
+            caminho_video,
+            modelo=modelo,
+            usar_pyannote=usar_pyannote,
+            hf_token=hf_token,
+            formatos=formatos,
+            arquivo_vozes=arquivo_vozes
+        )
     
     if not arquivo_bruto:
         print("\n❌ Transcrição falhou")
@@ -57,6 +75,19 @@ def pipeline_completo(
         print("\n❌ Pós-processamento falhou")
         return None
     
+    # Mantém o índice de busca atualizado (incremental)
+    try:
+        from indexar_transcricoes import abrir_indice, indexar_arquivo
+        
+        conn = abrir_indice(os.path.dirname(arquivo_limpo))
+        try:
+            indexar_arquivo(conn, arquivo_limpo, arquivo_bruto)
+            conn.commit()
+        finally:
+            conn.close()
+    except Exception as e:
+        print(f"⚠️  Não foi possível atualizar o índice de busca: {e}")
+    
     print()
     print("="*70)
     print("🎉 PIPELINE COMPLETO CONCLUÍDO")
@@ -83,11 +114,15 @@ if __name__ == "__main__":
         print("  --sem-pyannote     - Desabilita PyAnnote")
         print("  --hf-token TOKEN   - Token HuggingFace")
         print("  --limpeza MODO     - leve, medio, agressivo (padrão: medio)")
+        print("  --apenas-limpeza   - <arquivo> é uma transcrição bruta; só limpa")
+        print("  --formatos LISTA   - Saídas extras: srt,vtt,json,txt")
+        print("  --vozes ARQUIVO    - Vozes conhecidas (padrão: vozes/vozes.npz, se existir)")
         print("\nExemplos:")
         print('  python pipeline_completo.py "video.mp4"')
         print('  python pipeline_completo.py "video.mp4" small --limpeza agressivo')
         print('  python pipeline_completo.py "video.mp4" --hf-token hf_...')
         print('  python pipeline_completo.py "video.mp4" --sem-pyannote')
+        print('  python pipeline_completo.py "output/video_transcricao_bruta.txt" --apenas-limpeza')
         print("\n⚡ Recomendado:")
         print('  python pipeline_completo.py "video.mp4" small')
         sys.exit(1)
@@ -97,6 +132,9 @@ if __name__ == "__main__":
     usar_pyannote = True
     hf_token = None
     modo_limpeza = "medio"
+    apenas_limpeza = False
+    formatos = ()
+    arquivo_vozes = "vozes/vozes.npz"
     
     # Processa argumentos
     i = 2
@@ -112,6 +150,25 @@ if __name__ == "__main__":
         elif arg == '--limpeza' and i + 1 < len(sys.argv):
             modo_limpeza = sys.argv[i + 1]
             i += 1
+        elif arg == '--apenas-limpeza':
+            apenas_limpeza = True
+        elif arg == '--formatos' and i + 1 < len(sys.argv):
+            from formatos_saida import parse_formatos
+            try:
+                formatos = parse_formatos(sys.argv[i + 1])
+            except ValueError as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+            i += 1
+        elif arg == '--vozes' and i + 1 < len(sys.argv):
+            arquivo_vozes = sys.argv[i + 1].strip('"\'')
+            i += 1
         i += 1
     
-    pipeline_completo(caminho, modelo, usar_pyannote, hf_token, modo_limpeza)
+    if apenas_limpeza and formatos:
+        print("❌ --formatos não pode ser usado com --apenas-limpeza")
+        print("   Os formatos extras são gerados na etapa de transcrição.")
+        sys.exit(1)
+    
+    pipeline_completo(caminho, modelo, usar_pyannote, hf_token, modo_limpeza, apenas_limpeza,
+                      formatos, arquivo_vozes)
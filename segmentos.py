@@ -0,0 +1,51 @@
+"""
+SEGMENTOS - Tipo compartilhado entre transcrição e limpeza
+
+Um segmento é (start, end, speaker, text, words). A classe usa __slots__
+(sem __dict__ por instância), o que reduz bastante a memória em acervos
+grandes; os nomes de speaker são internados, então milhares de
+segmentos do mesmo speaker compartilham uma única string.
+
+Requer Python 3.10+ (dataclass com slots=True).
+"""
+import sys
+from dataclasses import dataclass
+
+@dataclass(slots=True)
+class Segmento:
+    start: float
+    end: float
+    speaker: str
+    text: str
+    words: tuple = ()  # ({'word', 'start', 'end'}, ...) - vazio se não calculado
+
+    def __post_init__(self):
+        self.speaker = sys.intern(self.speaker)
+
+def agrupar_por_speaker(segmentos):
+    """
+    Junta segmentos consecutivos do mesmo speaker em tempo linear.
+    Os textos de cada grupo são acumulados em lista e unidos uma vez só.
+    """
+    agrupados = []
+    if not segmentos:
+        return agrupados
+
+    primeiro = segmentos[0]
+    partes = [primeiro.text]
+    palavras = list(primeiro.words)
+    inicio, fim, speaker = primeiro.start, primeiro.end, primeiro.speaker
+
+    for s in segmentos[1:]:
+        if s.speaker == speaker:
+            partes.append(s.text)
+            palavras.extend(s.words)
+            fim = s.end
+        else:
+            agrupados.append(Segmento(inicio, fim, speaker, ' '.join(partes), tuple(palavras)))
+            partes = [s.text]
+            palavras = list(s.words)
+            inicio, fim, speaker = s.start, s.end, s.speaker
+
+    agrupados.append(Segmento(inicio, fim, speaker, ' '.join(partes), tuple(palavras)))
+    return agrupados
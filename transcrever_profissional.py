@@ -1,23 +1,43 @@
 """
 TRANSCREVER PROFISSIONAL - Com PyAnnote real + otimizações
+
+whisper, torch e pyannote.audio são importados apenas quando uma etapa
+realmente precisa deles, para que o uso/ajuda e o pipeline só de limpeza
+iniciem sem pagar o custo de importação.
 """
-import whisper
 import os
 import sys
 import time
-import torch
+import importlib.util
 from pathlib import Path
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings("ignore")
 
-# PyAnnote (opcional mas recomendado)
-try:
-    from pyannote.audio import Pipeline
-    PYANNOTE_AVAILABLE = True
-except ImportError:
-    PYANNOTE_AVAILABLE = False
-    print("⚠️  PyAnnote não instalado. Instale com: pip install pyannote-audio")
+from segmentos import Segmento
+
+# Opções de decodificação do Whisper (priorizam velocidade)
+# Para medir o custo em precisão: python avaliar_decodificacao.py
+OPCOES_DECODIFICACAO = {
+    'beam_size': 1,
+    'best_of': 1,
+    'temperature': 0.0,
+    'condition_on_previous_text': False,
+}
+
+_PYANNOTE_AVAILABLE = None
+
+def pyannote_disponivel():
+    """Verifica se PyAnnote está instalado (sem importá-lo)"""
+    global _PYANNOTE_AVAILABLE
+    if _PYANNOTE_AVAILABLE is None:
+        try:
+            _PYANNOTE_AVAILABLE = importlib.util.find_spec("pyannote.audio") is not None
+        except ImportError:
+            _PYANNOTE_AVAILABLE = False
+        if not _PYANNOTE_AVAILABLE:
+            print("⚠️  PyAnnote não instalado. Instale com: pip install pyannote-audio")
+    return _PYANNOTE_AVAILABLE
 
 def formatar_timestamp(segundos):
     """Formata timestamp como HH:MM:SS"""
@@ -26,16 +46,22 @@ def formatar_timestamp(segundos):
     s = int(segundos % 60)
     return f"{h}:{m:02d}:{s:02d}"
 
-def diarizar_pyannote(audio_file: str, hf_token: str = None):
+def diarizar_pyannote(audio_file: str, hf_token: str = None, arquivo_vozes: str = None):
     """
     Diarização REAL com PyAnnote
     Retorna segmentos com speaker identificado
+    
+    Se arquivo_vozes existir, os clusters são renomeados para as vozes
+    cadastradas mais próximas (ver vozes_conhecidas.py)
     """
-    if not PYANNOTE_AVAILABLE:
+    if not pyannote_disponivel():
         print("❌ PyAnnote não disponível")
         return None
     
     try:
+        import torch
+        from pyannote.audio import Pipeline
+        
         print("🔍 Iniciando diarização com PyAnnote...")
         print("   (Isso pode levar alguns minutos...)")
         
@@ -55,18 +81,34 @@ def diarizar_pyannote(audio_file: str, hf_token: str = None):
         if torch.cuda.is_available():
             pipeline.to(torch.device("cuda"))
         
-        # Executa diarização
+        # Executa diarização (com centróides por speaker se houver vozes cadastradas)
+        usar_vozes = bool(arquivo_vozes) and os.path.exists(arquivo_vozes)
         inicio = time.time()
-        diarization = pipeline(audio_file)
+        if usar_vozes:
+            diarization, centroides = pipeline(audio_file, return_embeddings=True)
+        else:
+            diarization = pipeline(audio_file)
         tempo = time.time() - inicio
         
+        # Identifica speakers conhecidos
+        nomes = {}
+        if usar_vozes:
+            try:
+                from vozes_conhecidas import identificar_speakers
+                
+                nomes = identificar_speakers(diarization.labels(), centroides, arquivo_vozes)
+                for label, nome in sorted(nomes.items()):
+                    print(f"   🎤 {label} → {nome}")
+            except Exception as e:
+                print(f"⚠️  Erro ao identificar vozes conhecidas: {e}")
+        
         # Extrai segmentos
         segmentos = []
         for turn, _, speaker in diarization.itertracks(yield_label=True):
             segmentos.append({
                 'start': turn.start,
                 'end': turn.end,
-                'speaker': speaker
+                'speaker': nomes.get(speaker, speaker)
             })
         
         num_speakers = len(set(s['speaker'] for s in segmentos))
@@ -84,8 +126,12 @@ def diarizar_pyannote(audio_file: str, hf_token: str = None):
         print("   4. Use: --hf-token SEU_TOKEN")
         return None
 
-def transcrever_segmento(model, audio_file: str, start: float, end: float, tem_gpu: bool):
-    """Transcreve um segmento específico do áudio"""
+def transcrever_segmento(model, audio_file: str, start: float, end: float, tem_gpu: bool,
+                         palavras: bool = False):
+    """
+    Transcreve um segmento específico do áudio
+    Retorna (texto, palavras) - palavras com tempos absolutos se solicitado
+    """
     import subprocess
     import tempfile
     
@@ -111,18 +157,25 @@ def transcrever_segmento(model, audio_file: str, start: float, end: float, tem_g
             temp_path,
             language='pt',
             fp16=tem_gpu,
-            beam_size=1,
-            best_of=1,
-            temperature=0.0,
-            condition_on_previous_text=False,
-            word_timestamps=False,
+            word_timestamps=palavras,
+            **OPCOES_DECODIFICACAO
         )
         
-        return resultado.get('text', '').strip()
+        lista_palavras = []
+        if palavras:
+            for seg in resultado.get('segments', []):
+                for w in seg.get('words', []):
+                    lista_palavras.append({
+                        'word': w['word'],
+                        'start': start + w['start'],
+                        'end': start + w['end']
+                    })
+        
+        return resultado.get('text', '').strip(), lista_palavras
         
     except Exception as e:
         print(f"⚠️  Erro ao transcrever segmento: {e}")
-        return ""
+        return "", []
     finally:
         if os.path.exists(temp_path):
             os.remove(temp_path)
@@ -131,10 +184,16 @@ def transcrever_profissional(
     caminho_video: str,
     modelo: str = "small",
     usar_pyannote: bool = True,
-    hf_token: str = None
+    hf_token: str = None,
+    formatos: tuple = (),
+    arquivo_vozes: str = "vozes/vozes.npz"
 ):
     """
     Transcrição profissional com diarização real
+    
+    formatos: formatos extras (srt, vtt, json, txt) gravados junto com o
+    TXT bruto, direto dos segmentos em memória
+    arquivo_vozes: voiceprints usados para nomear os speakers (se existir)
     """
     print("="*70)
     print("⚡ TRANSCRIÇÃO PROFISSIONAL")
@@ -149,6 +208,14 @@ def transcrever_profissional(
     print(f"📁 Arquivo: {os.path.basename(caminho_video)}")
     print(f"📊 Tamanho: {tamanho_mb:.2f} MB")
     
+    try:
+        import torch
+        import whisper
+    except ImportError as e:
+        print(f"❌ Dependência não instalada: {e.name}")
+        print("   Instale com: pip install -r requirements.txt")
+        return None
+    
     tem_gpu = torch.cuda.is_available()
     if tem_gpu:
         print(f"✓ GPU: {torch.cuda.get_device_name(0)}")
@@ -156,14 +223,20 @@ def transcrever_profissional(
         print("⚠️  CPU (mais lento)")
     
     print(f"🤖 Modelo Whisper: {modelo}")
-    print(f"🎤 PyAnnote: {'Sim' if usar_pyannote and PYANNOTE_AVAILABLE else 'Não'}")
+    usar_pyannote = usar_pyannote and pyannote_disponivel()
+    print(f"🎤 PyAnnote: {'Sim' if usar_pyannote else 'Não'}")
+    if formatos:
+        print(f"📦 Formatos extras: {', '.join(formatos)}")
     print()
     
+    # Tempos por palavra só são calculados se algum formato os usa
+    palavras = 'json' in formatos
+    
     try:
         # ETAPA 1: Diarização (se habilitado)
         segmentos_diarizados = None
-        if usar_pyannote and PYANNOTE_AVAILABLE:
-            segmentos_diarizados = diarizar_pyannote(caminho_video, hf_token)
+        if usar_pyannote:
+            segmentos_diarizados = diarizar_pyannote(caminho_video, hf_token, arquivo_vozes)
             
             if not segmentos_diarizados:
                 print("\n⚠️  Diarização falhou, usando modo simplificado")
@@ -202,21 +275,23 @@ def transcrever_profissional(
                 if i % 10 == 0 or i == 1:
                     print(f"   Processando {i}/{len(segmentos_diarizados)}...")
                 
-                texto = transcrever_segmento(
+                texto, lista_palavras = transcrever_segmento(
                     model,
                     caminho_video,
                     seg_dia['start'],
                     seg_dia['end'],
-                    tem_gpu
+                    tem_gpu,
+                    palavras
                 )
                 
                 if texto:
-                    segmentos_finais.append({
-                        'start': seg_dia['start'],
-                        'end': seg_dia['end'],
-                        'speaker': seg_dia['speaker'],
-                        'text': texto
-                    })
+                    segmentos_finais.append(Segmento(
+                        seg_dia['start'],
+                        seg_dia['end'],
+                        seg_dia['speaker'],
+                        texto,
+                        tuple(lista_palavras)
+                    ))
             
             tempo_total = time.time() - inicio
             print(f"\n✓ Transcrição concluída em {tempo_total/60:.1f} min")
@@ -233,11 +308,8 @@ def transcrever_profissional(
                 language='pt',
                 fp16=tem_gpu,
                 verbose=False,
-                beam_size=1,
-                best_of=1,
-                temperature=0.0,
-                condition_on_previous_text=False,
-                word_timestamps=False,
+                word_timestamps=palavras,
+                **OPCOES_DECODIFICACAO
             )
             
             tempo_total = time.time() - inicio
@@ -254,12 +326,13 @@ def transcrever_profissional(
                     if pausa > 2.5:
                         speaker_atual += 1
                 
-                segmentos_finais.append({
-                    'start': seg['start'],
-                    'end': seg['end'],
-                    'speaker': f'Speaker {speaker_atual}',
-                    'text': seg['text'].strip()
-                })
+                segmentos_finais.append(Segmento(
+                    seg['start'],
+                    seg['end'],
+                    f'Speaker {speaker_atual}',
+                    seg['text'].strip(),
+                    tuple(seg.get('words', ()))
+                ))
         
         # ETAPA 4: Salva resultado BRUTO
         nome_base = Path(caminho_video).stem
@@ -274,30 +347,48 @@ def transcrever_profissional(
             f.write(f"🤖 Modelo: {modelo}\n")
             f.write(f"🎤 Diarização: {'PyAnnote' if segmentos_diarizados else 'Simplificada'}\n")
             f.write(f"📊 Segmentos: {len(segmentos_finais)}\n")
-            f.write(f"🎤 Speakers: {len(set(s['speaker'] for s in segmentos_finais))}\n")
+            f.write(f"🎤 Speakers: {len(set(s.speaker for s in segmentos_finais))}\n")
             f.write("\n" + "="*70 + "\n")
             f.write("TRANSCRIÇÃO BRUTA\n")
             f.write("="*70 + "\n\n")
             
             speaker_anterior = None
             for seg in segmentos_finais:
-                if speaker_anterior and speaker_anterior != seg['speaker']:
+                if speaker_anterior and speaker_anterior != seg.speaker:
                     f.write("\n")
                 
-                timestamp = formatar_timestamp(seg['start'])
-                f.write(f"[{timestamp}] {seg['speaker']}:\n")
-                f.write(f"{seg['text']}\n\n")
+                timestamp = formatar_timestamp(seg.start)
+                f.write(f"[{timestamp}] {seg.speaker}:\n")
+                f.write(f"{seg.text}\n\n")
                 
-                speaker_anterior = seg['speaker']
+                speaker_anterior = seg.speaker
+        
+        # ETAPA 5: Formatos extras (uma única passada)
+        arquivos_extras = {}
+        if formatos:
+            from formatos_saida import escrever_saidas
+            
+            arquivos_extras = escrever_saidas(
+                segmentos_finais,
+                nome_base,
+                formatos,
+                metadados={
+                    'arquivo': os.path.basename(caminho_video),
+                    'modelo': modelo,
+                    'diarizacao': 'PyAnnote' if segmentos_diarizados else 'Simplificada'
+                }
+            )
         
         # Stats
-        num_speakers = len(set(s['speaker'] for s in segmentos_finais))
-        num_palavras = sum(len(s['text'].split()) for s in segmentos_finais)
+        num_speakers = len(set(s.speaker for s in segmentos_finais))
+        num_palavras = sum(len(s.text.split()) for s in segmentos_finais)
         
         print("\n" + "="*70)
         print("✅ TRANSCRIÇÃO CONCLUÍDA")
         print("="*70)
         print(f"📄 Arquivo: {arquivo_bruto}")
+        for formato, caminho_extra in arquivos_extras.items():
+            print(f"📄 {formato.upper()}: {caminho_extra}")
         print(f"📊 Segmentos: {len(segmentos_finais)}")
         print(f"🎤 Speakers: {num_speakers}")
         print(f"📝 Palavras: {num_palavras:,}")
@@ -326,11 +417,14 @@ if __name__ == "__main__":
         print("  [modelo]           - tiny, base, small, medium, large (padrão: small)")
         print("  --sem-pyannote     - Desabilita diarização PyAnnote")
         print("  --hf-token TOKEN   - Token HuggingFace para PyAnnote")
+        print("  --formatos LISTA   - Saídas extras: srt,vtt,json,txt (ex: --formatos srt,json)")
+        print("  --vozes ARQUIVO    - Vozes conhecidas (padrão: vozes/vozes.npz, se existir)")
         print("\nExemplos:")
         print('  python transcrever_profissional.py "video.mp4"')
         print('  python transcrever_profissional.py "video.mp4" small')
         print('  python transcrever_profissional.py "video.mp4" --hf-token hf_...')
         print('  python transcrever_profissional.py "video.mp4" --sem-pyannote')
+        print('  python transcrever_profissional.py "video.mp4" --formatos srt,vtt,json')
         print("\n💡 Para usar PyAnnote (diarização real):")
         print("   1. pip install pyannote-audio")
         print("   2. Aceite termos: https://hf.co/pyannote/speaker-diarization-3.1")
@@ -341,6 +435,8 @@ if __name__ == "__main__":
     modelo = "small"
     usar_pyannote = True
     hf_token = None
+    formatos = ()
+    arquivo_vozes = "vozes/vozes.npz"
     
     # Processa argumentos
     i = 2
@@ -353,6 +449,17 @@ if __name__ == "__main__":
         elif arg == '--hf-token' and i + 1 < len(sys.argv):
             hf_token = sys.argv[i + 1]
             i += 1
+        elif arg == '--formatos' and i + 1 < len(sys.argv):
+            from formatos_saida import parse_formatos
+            try:
+                formatos = parse_formatos(sys.argv[i + 1])
+            except ValueError as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+            i += 1
+        elif arg == '--vozes' and i + 1 < len(sys.argv):
+            arquivo_vozes = sys.argv[i + 1].strip('"\'')
+            i += 1
         i += 1
     
-    transcrever_profissional(caminho, modelo, usar_pyannote, hf_token)
+    transcrever_profissional(caminho, modelo, usar_pyannote, hf_token, formatos, arquivo_vozes)
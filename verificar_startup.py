@@ -0,0 +1,119 @@
+"""
+VERIFICAR STARTUP - Orçamento de tempo de inicialização dos CLIs
+
+Roda cada operação barata (ajuda, limpeza, lote já em cache) num
+processo novo com `python -X importtime` e falha se:
+  - algum módulo pesado (whisper, torch, pyannote) for importado
+  - o tempo total ultrapassar o orçamento
+  - o processo quebrar (Traceback) ou, fora das telas de ajuda (que saem
+    com código 1 por design), terminar com código diferente de zero
+"""
+import sys
+import os
+import re
+import time
+import shutil
+import tempfile
+import subprocess
+
+# Orçamento por operação (segundos)
+ORCAMENTO_SEGUNDOS = 0.5
+
+MODULOS_PESADOS = ('whisper', 'torch', 'torchaudio', 'pyannote', 'numpy')
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+BRUTO_EXEMPLO = """======================================================================
+📝 TRANSCRIÇÃO BRUTA (SEM CORREÇÕES)
+======================================================================
+
+======================================================================
+TRANSCRIÇÃO BRUTA
+======================================================================
+
+[0:00:01] Speaker 1:
+Então, né, a ideia do pepit é mostrar o chat IPT.
+
+[0:00:09] Speaker 2:
+Tipo assim, faltou o call to action.
+
+"""
+
+def operacoes(pasta_tmp):
+    """Operações que devem iniciar rápido: (nome, argumentos, é_ajuda)"""
+    bruto = os.path.join(pasta_tmp, "output", "exemplo_transcricao_bruta.txt")
+    return [
+        ("transcrever (ajuda)", ["transcrever_profissional.py"], True),
+        ("limpar (ajuda)", ["limpar_profissional.py"], True),
+        ("pipeline (ajuda)", ["pipeline_completo.py"], True),
+        ("pipeline (apenas limpeza)", ["pipeline_completo.py", bruto, "--apenas-limpeza"], False),
+        ("limpar", ["limpar_profissional.py", bruto], False),
+        ("limpeza em lote", ["limpar_em_lote.py", "output", "--workers", "1"], False),
+        ("limpeza em lote (cache)", ["limpar_em_lote.py", "output"], False),
+    ]
+
+def medir(args, cwd):
+    """
+    Executa um script com -X importtime
+    Retorna (segundos, módulos importados, código de saída, stderr sem as linhas de importtime)
+    """
+    cmd = [sys.executable, "-X", "importtime"]
+    cmd += [os.path.join(PASTA, args[0])] + args[1:]
+    env = dict(os.environ, PYTHONIOENCODING="utf-8")
+
+    inicio = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=cwd, env=env, capture_output=True, text=True, encoding="utf-8")
+    tempo = time.perf_counter() - inicio
+
+    modulos = re.findall(r'^import time:\s+\d+\s+\|\s+\d+\s+\|\s*(\S+)', proc.stderr, re.MULTILINE)
+    erros = '\n'.join(l for l in proc.stderr.splitlines() if not l.startswith('import time:'))
+    return tempo, modulos, proc.returncode, erros
+
+def verificar_startup(orcamento=ORCAMENTO_SEGUNDOS):
+    """Verifica todas as operações; retorna True se todas couberem no orçamento"""
+    print("="*70)
+    print("⏱️  VERIFICAÇÃO DE STARTUP")
+    print("="*70)
+    print(f"🎯 Orçamento: {orcamento:.2f}s por operação")
+    print()
+
+    pasta_tmp = tempfile.mkdtemp(prefix="startup_")
+    ok = True
+
+    try:
+        os.makedirs(os.path.join(pasta_tmp, "output"))
+        for nome, args, ajuda in operacoes(pasta_tmp):
+            # Restaura o arquivo bruto (limpeza pode ser executada várias vezes)
+            bruto = os.path.join(pasta_tmp, "output", "exemplo_transcricao_bruta.txt")
+            with open(bruto, 'w', encoding='utf-8') as f:
+                f.write(BRUTO_EXEMPLO)
+
+            tempo, modulos, codigo, erros = medir(args, pasta_tmp)
+            pesados = sorted(set(
+                m.split('.')[0] for m in modulos if m.split('.')[0] in MODULOS_PESADOS
+            ))
+            quebrou = 'Traceback' in erros or (codigo != 0 and not ajuda)
+
+            status = "✓" if tempo <= orcamento and not pesados and not quebrou else "❌"
+            print(f"{status} {nome:<28} {tempo:6.3f}s  ({len(modulos)} módulos)")
+            if pesados:
+                print(f"   ⚠️  Importou módulos pesados: {', '.join(pesados)}")
+            if quebrou:
+                print(f"   ⚠️  Falhou (código de saída {codigo})")
+                for linha in erros.strip().splitlines()[-5:]:
+                    print(f"      {linha}")
+            if status != "✓":
+                ok = False
+    finally:
+        shutil.rmtree(pasta_tmp, ignore_errors=True)
+
+    print()
+    print("="*70)
+    print("✅ DENTRO DO ORÇAMENTO" if ok else "❌ FORA DO ORÇAMENTO OU COM ERROS")
+    print("="*70)
+
+    return ok
+
+if __name__ == "__main__":
+    orcamento = float(sys.argv[1]) if len(sys.argv) > 1 else ORCAMENTO_SEGUNDOS
+    sys.exit(0 if verificar_startup(orcamento) else 1)
@@ -0,0 +1,208 @@
+"""
+VOZES CONHECIDAS - Cadastro de voiceprints e identificação de speakers
+
+Cada speaker recorrente é cadastrado uma vez a partir de amostras de
+áudio; o embedding (mesmo modelo usado pela diarização do PyAnnote 3.1)
+fica salvo em um .npz local e é reutilizado em todas as execuções.
+
+Depois da diarização, os centróides de cada cluster (SPEAKER_00, ...)
+são comparados com todas as vozes cadastradas numa única multiplicação
+de matrizes (similaridade de cosseno), e cada cluster recebe o nome da
+voz mais próxima acima do limiar.
+
+numpy e pyannote.audio só são importados quando usados.
+"""
+import sys
+import os
+
+ARQUIVO_VOZES = "vozes/vozes.npz"
+MODELO_EMBEDDING = "pyannote/wespeaker-voxceleb-resnet34-LM"
+
+# Similaridade de cosseno mínima para aceitar uma identificação
+LIMIAR_SIMILARIDADE = 0.5
+
+# Cache por processo: caminho → (mtime, nomes, matriz normalizada)
+_CACHE = {}
+
+def _normalizar_linhas(matriz):
+    import numpy as np
+    normas = np.linalg.norm(matriz, axis=1, keepdims=True)
+    return matriz / np.maximum(normas, 1e-12)
+
+def carregar_vozes(caminho=ARQUIVO_VOZES):
+    """Retorna (nomes, matriz n×d com linhas normalizadas); vazio se não existir"""
+    import numpy as np
+
+    if not os.path.exists(caminho):
+        return [], np.zeros((0, 0), dtype=np.float32)
+
+    mtime = os.path.getmtime(caminho)
+    cache = _CACHE.get(caminho)
+    if cache and cache[0] == mtime:
+        return cache[1], cache[2]
+
+    with np.load(caminho, allow_pickle=False) as dados:
+        nomes = [str(n) for n in dados['nomes']]
+        matriz = dados['embeddings'].astype(np.float32)
+
+    _CACHE[caminho] = (mtime, nomes, matriz)
+    return nomes, matriz
+
+def salvar_vozes(nomes, matriz, caminho=ARQUIVO_VOZES):
+    """Grava o arquivo de vozes de forma atômica"""
+    import numpy as np
+
+    pasta = os.path.dirname(caminho)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+
+    temp = caminho + ".tmp.npz"
+    np.savez(temp, nomes=np.array(nomes, dtype=str), embeddings=matriz.astype(np.float32))
+    os.replace(temp, caminho)
+    _CACHE.pop(caminho, None)
+
+def calcular_embedding(amostras, hf_token=None):
+    """Embedding médio (normalizado) de uma ou mais amostras de áudio"""
+    import numpy as np
+    import torch
+    from pyannote.audio import Inference, Model
+
+    model = Model.from_pretrained(MODELO_EMBEDDING, use_auth_token=hf_token)
+    inference = Inference(model, window="whole")
+    if torch.cuda.is_available():
+        inference.to(torch.device("cuda"))
+
+    embeddings = np.vstack([np.asarray(inference(a), dtype=np.float32).reshape(1, -1) for a in amostras])
+    return _normalizar_linhas(embeddings.mean(axis=0, keepdims=True))[0]
+
+def cadastrar_voz(nome, amostras, caminho=ARQUIVO_VOZES, hf_token=None):
+    """Cadastra (ou substitui) a voz de um speaker"""
+    import numpy as np
+
+    for amostra in amostras:
+        if not os.path.exists(amostra):
+            print(f"❌ Amostra não encontrada: {amostra}")
+            return False
+
+    print(f"🎙️  Calculando voiceprint de {nome} ({len(amostras)} amostra(s))...")
+    embedding = calcular_embedding(amostras, hf_token)
+
+    nomes, matriz = carregar_vozes(caminho)
+    if nome in nomes:
+        matriz = matriz.copy()
+        matriz[nomes.index(nome)] = embedding
+        print(f"✓ {nome} atualizado")
+    else:
+        if matriz.size and matriz.shape[1] != embedding.shape[0]:
+            print(f"❌ Dimensão incompatível com o arquivo ({matriz.shape[1]} ≠ {embedding.shape[0]})")
+            return False
+        nomes = nomes + [nome]
+        matriz = np.vstack([matriz.reshape(-1, embedding.shape[0]), embedding[None, :]])
+        print(f"✓ {nome} cadastrado")
+
+    salvar_vozes(nomes, matriz, caminho)
+    return True
+
+def remover_voz(nome, caminho=ARQUIVO_VOZES):
+    import numpy as np
+
+    nomes, matriz = carregar_vozes(caminho)
+    if nome not in nomes:
+        print(f"❌ Voz não cadastrada: {nome}")
+        return False
+
+    i = nomes.index(nome)
+    salvar_vozes(nomes[:i] + nomes[i+1:], np.delete(matriz, i, axis=0), caminho)
+    print(f"✓ {nome} removido")
+    return True
+
+def identificar_speakers(labels, centroides, caminho=ARQUIVO_VOZES, limiar=LIMIAR_SIMILARIDADE):
+    """
+    Mapeia cada label da diarização para a voz cadastrada mais próxima.
+
+    labels: lista de labels (ordem das linhas de centroides)
+    centroides: matriz k×d com o embedding de cada cluster
+    Retorna {label: nome} só para os clusters identificados; cada voz é
+    atribuída no máximo a um cluster (os pares mais similares primeiro).
+    """
+    import numpy as np
+
+    nomes, vozes = carregar_vozes(caminho)
+    if not nomes or len(labels) == 0:
+        return {}
+
+    centroides = np.asarray(centroides, dtype=np.float32)
+    validos = ~np.isnan(centroides).any(axis=1)
+    if not validos.any():
+        return {}
+
+    # k×n similaridades de cosseno em uma única operação
+    similaridades = np.full((len(labels), len(nomes)), -np.inf, dtype=np.float32)
+    similaridades[validos] = _normalizar_linhas(centroides[validos]) @ _normalizar_linhas(vozes).T
+
+    mapa = {}
+    ordem = np.argsort(similaridades, axis=None)[::-1]
+    usados = set()
+    for indice in ordem:
+        i, j = divmod(int(indice), len(nomes))
+        if similaridades[i, j] < limiar:
+            break
+        if labels[i] in mapa or j in usados:
+            continue
+        mapa[labels[i]] = nomes[j]
+        usados.add(j)
+        if len(mapa) == len(labels) or len(usados) == len(nomes):
+            break
+
+    return mapa
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] not in ('cadastrar', 'listar', 'remover'):
+        print("="*70)
+        print("🎤 VOZES CONHECIDAS")
+        print("="*70)
+        print("\nUso:")
+        print('  python vozes_conhecidas.py cadastrar "Nome" amostra.wav [amostra2.wav ...] [--hf-token TOKEN]')
+        print('  python vozes_conhecidas.py listar')
+        print('  python vozes_conhecidas.py remover "Nome"')
+        print("\nOpções:")
+        print(f"  --vozes ARQUIVO    - Arquivo de vozes (padrão: {ARQUIVO_VOZES})")
+        print("  --hf-token TOKEN   - Token HuggingFace (cadastrar)")
+        print("\n💡 Com vozes cadastradas, transcrever_profissional.py renomeia")
+        print("   automaticamente os speakers identificados após a diarização.")
+        sys.exit(1)
+
+    comando = sys.argv[1]
+    caminho = ARQUIVO_VOZES
+    hf_token = None
+    posicionais = []
+
+    i = 2
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg == '--vozes' and i + 1 < len(sys.argv):
+            caminho = sys.argv[i + 1].strip('"\'')
+            i += 1
+        elif arg == '--hf-token' and i + 1 < len(sys.argv):
+            hf_token = sys.argv[i + 1]
+            i += 1
+        elif arg.startswith('--'):
+            print(f"❌ Opção desconhecida ou sem valor: {arg}")
+            sys.exit(1)
+        else:
+            posicionais.append(arg.strip('"\''))
+        i += 1
+
+    if comando == 'listar':
+        nomes, matriz = carregar_vozes(caminho)
+        print(f"🎤 {len(nomes)} voz(es) em {caminho}")
+        for nome in nomes:
+            print(f"   - {nome}")
+    elif comando == 'cadastrar' and len(posicionais) >= 2:
+        ok = cadastrar_voz(posicionais[0], posicionais[1:], caminho, hf_token)
+        sys.exit(0 if ok else 1)
+    elif comando == 'remover' and posicionais:
+        sys.exit(0 if remover_voz(posicionais[0], caminho) else 1)
+    else:
+        print("❌ Argumentos insuficientes (rode sem argumentos para ver o uso)")
+        sys.exit(1)